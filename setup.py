@@ -1,4 +1,6 @@
+import os
 from setuptools import setup
+from setuptools.command.build_py import build_py
 
 try:
     VERSIONFILE = "vedo/version.py"
@@ -7,6 +9,32 @@ try:
 except:
     verstr = "unknown"
 
+
+class BuildPyWithFontsManifest(build_py):
+    """Write the list of available fonts into the built package,
+    so that an installed vedo does not need to scan the fonts folder at every import.
+    Source checkouts have no manifest and scan the folder instead."""
+
+    def run(self):
+        super().run()
+        if self.dry_run:
+            return
+        fontsdir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vedo", "fonts")
+        try:
+            fontnames = sorted(
+                f.partition(".")[0] for f in os.listdir(fontsdir) if not f.endswith(".npz")
+            )
+            target = os.path.join(self.build_lib, "vedo", "_fonts_manifest.py")
+            with open(target, "w") as fm:
+                fm.write("# This file is generated by setup.py, do not edit.\n")
+                fm.write("FONTS = (\n")
+                for fontname in fontnames:
+                    fm.write(f'    "{fontname}",\n')
+                fm.write(")\n")
+        except OSError as e:
+            self.warn(f"could not write the fonts manifest: {e}")
+
+
 ##############################################################
 setup(
     name="vedo",
@@ -46,6 +74,7 @@ setup(
 
     install_requires=["vtk", "numpy", "Deprecated", "Pygments"],
     include_package_data=True,
+    cmdclass={"build_py": BuildPyWithFontsManifest},
 
     description="A python module for scientific analysis and visualization of 3D objects and point clouds based on VTK.",
     long_description="A python module for scientific visualization, analysis of 3D objects and point clouds based on VTK. Check out https://vedo.embl.es for documentation.",
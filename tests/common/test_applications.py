@@ -0,0 +1,141 @@
+# Check the vectorized Animation bookings and the parallel IsosurfaceBrowser
+# against the per-step results they replaced
+import numpy as np
+import vedo
+from vedo import Sphere, Cube, Volume, get_color
+from vedo.utils import lin_interpolate
+from vedo.applications import Animation, IsosurfaceBrowser
+
+
+def events_of(anim, action):
+    return [e for e in anim.events if e[1] == action]
+
+
+def check_ramp(events, t, duration, start, end):
+    # each value must be the linear interpolation at the event time
+    assert len(events) == int(duration / 0.02 + 0.5) + 1
+    for tt, _, _, value in events:
+        expected = lin_interpolate(tt, [t, t + duration], [start, end])
+        assert np.allclose(value, expected), (tt, value, expected)
+
+
+######################################################## Animation
+def test_animation():
+    s = Sphere().color("red").lw(1).pos(1, 2, 3)
+    c = Cube().color("blue").lw(3)
+    anim = Animation(show_progressbar=False, video_filename=None)
+
+    anim.fade_in([s, c], t=0, duration=0.5)
+    check_ramp(events_of(anim, anim.fade_in), 0, 0.5, 0, 1)
+
+    anim.fade_out([s, c], t=1, duration=0.3)
+    check_ramp(events_of(anim, anim.fade_out), 1, 0.3, 1, 0)
+
+    anim.scale(s, 2.5, t=0.2, duration=0.4)
+    check_ramp(events_of(anim, anim.scale), 0.2, 0.4, 1, 2.5)
+
+    anim.change_color("green", [s, c], t=0.1, duration=0.6)
+    for tt, _, _, values in events_of(anim, anim.change_color):
+        for a, col in zip([s, c], values):
+            expected = [
+                lin_interpolate(tt, [0.1, 0.7], [a.color()[j], get_color("green")[j]])
+                for j in range(3)
+            ]
+            assert np.allclose(col, expected)
+
+    anim.change_line_width(5, [s, c], t=0, duration=0.2)
+    for tt, _, _, values in events_of(anim, anim.change_line_width):
+        for a, lw in zip([s, c], values):
+            assert np.isclose(lw, lin_interpolate(tt, [0, 0.2], [a.lw(), 5]))
+
+    pr = s.GetProperty()
+    pars0 = (pr.GetAmbient(), pr.GetDiffuse(), pr.GetSpecular(), pr.GetSpecularPower())
+    anim.change_lighting("glossy", s, t=0, duration=0.2)
+    for tt, _, _, values in events_of(anim, anim.change_lighting):
+        expected = [
+            lin_interpolate(tt, [0, 0.2], [p0, p1])
+            for p0, p1 in zip(pars0, (0.1, 0.7, 0.9, 90))
+        ]
+        assert np.allclose(values[0], expected)
+
+    for style in ("linear", "quadratic"):
+        anim2 = Animation(show_progressbar=False, video_filename=None)
+        anim2.move(s, (4, 5, 6), t=0, duration=0.3, style=style)
+        moves = events_of(anim2, anim2.move)
+        n = len(moves)
+        dv = (np.array((4, 5, 6)) - s.pos()) / n
+        for i, (_, _, _, p) in enumerate(moves, 1):
+            w = i * (i / n) ** 2 if style == "quadratic" else i
+            assert np.allclose(p, s.pos() + dv * w)
+        assert np.allclose(moves[-1][3], (4, 5, 6))
+
+    anim.rotate(s, "z", 90, t=0, duration=0.2)
+    rots = events_of(anim, anim.rotate)
+    assert all(r[3] == ("z", 90 / len(rots)) for r in rots)
+
+    # erosion removes the points within a growing radius from the corner
+    m = Sphere(res=12)
+    anim.mesh_erode(m, corner=6, t=0, duration=0.2)
+    x0, x1, y0, y1, z0, z1 = m.GetBounds()
+    corner = (x1, y1, z1)
+    dmin = np.linalg.norm(m.closest_point(corner) - corner)
+    for tt, _, _, ids in events_of(anim, anim.mesh_erode):
+        d = lin_interpolate(tt, [0, 0.2], [dmin, m.diagonal_size() * 1.01])
+        expected = m.closest_point(corner, radius=d, return_point_id=True)
+        assert sorted(ids.tolist()) == sorted(np.asarray(expected).tolist())
+
+    # events at equal times keep their booking order once sorted
+    times = [e[0] for e in anim.events]
+    order = np.argsort(times, kind="stable")
+    assert [anim.events[i] for i in order] == sorted(anim.events, key=lambda e: e[0])
+
+
+######################################################## IsosurfaceBrowser
+def surfaces(plt):
+    acts = plt.renderer.GetActors()
+    out = []
+    for i in range(acts.GetNumberOfItems()):
+        a = acts.GetItemAsObject(i)
+        pts = a.GetMapper().GetInput().GetPoints()
+        pr = a.GetProperty()
+        look = (
+            pr.GetColor(),
+            pr.GetOpacity(),
+            pr.GetInterpolation(),
+            pr.GetLineWidth(),
+            pr.GetAmbient(),
+            pr.GetDiffuse(),
+            pr.GetSpecular(),
+            a.GetMapper().GetScalarRange(),
+        )
+        out.append(
+            (
+                vedo.utils.vtk2numpy(pts.GetData()) if pts else np.zeros((0, 3)),
+                np.hstack(look),
+                (a.GetMapper().GetScalarVisibility(), a.GetMapper().GetScalarMode()),
+            )
+        )
+    return out
+
+
+def test_isosurface_browser():
+    x, y, z = np.mgrid[:30, :30, :30]
+    vol = Volume(np.sqrt((x - 15.0) ** 2 + (y - 15) ** 2 + (z - 15) ** 2))
+    for lego in (False, True):
+        serial = surfaces(
+            IsosurfaceBrowser(vol, lego=lego, precompute=True, res=6, c="red", alpha=0.5)
+        )
+        parallel = surfaces(
+            IsosurfaceBrowser(vol, lego=lego, precompute=True, res=6, c="red", alpha=0.5, nprocs=2)
+        )
+        assert len(serial) == len(parallel)
+        for (p1, c1, s1), (p2, c2, s2) in zip(serial, parallel):
+            assert p1.shape == p2.shape and np.allclose(p1, p2)
+            if len(p1):  # empty surfaces draw nothing, their look does not matter
+                assert np.allclose(c1, c2) and s1 == s2
+
+
+if __name__ == "__main__":  # the process pool may re-import this module
+    test_animation()
+    test_isosurface_browser()
+    print("Animation and IsosurfaceBrowser OK")
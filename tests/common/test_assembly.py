@@ -0,0 +1,46 @@
+# Check Group and Assembly membership after their contents are changed
+from vedo import Group, Assembly, Sphere, Cube, Cone
+
+s, c, k = Sphere(), Cube(), Cone()
+
+######################################################## Group
+grp = Group([s, c])
+assert grp.unpack() == [s, c]
+
+grp += k
+assert grp.unpack() == [s, c, k]
+
+grp.RemovePart(c)  # straight through vtk, unpack() must not serve a stale list
+assert grp.unpack() == [s, k]
+
+grp.AddPart(c)
+assert grp.unpack() == [s, k, c]
+
+elements = grp.unpack()
+elements.append(Sphere())  # the returned list is a copy
+assert len(grp.unpack()) == 3
+
+grp.clear()
+assert grp.unpack() == []
+assert grp.GetParts().GetNumberOfItems() == 0
+
+######################################################## Assembly
+asm = Assembly(s, c)
+assert s in asm and c in asm
+assert k not in asm
+
+asm += k
+assert k in asm
+
+asm.actors.remove(c)  # direct edits of the actors list are seen too
+assert c not in asm
+asm.actors.append(c)
+assert c in asm
+
+asm2 = Assembly(asm, Cone())
+assert asm in asm2
+assert s not in asm2
+assert s in asm2.recursive_unpack()
+assert len(asm2.recursive_unpack()) == 4
+
+print("Group/Assembly membership OK")
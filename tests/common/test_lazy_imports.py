@@ -0,0 +1,70 @@
+# Check that the lazily resolved vedo namespace still exposes
+# every public name that was reachable when all submodules were imported eagerly
+import types
+import vedo
+
+BASELINE_NAMES = [
+    'Arc', 'Arrow', 'Arrow2D', 'Arrows', 'Arrows2D', 'Assembly', 'Axes', 'Base3DProp',
+    'BaseActor', 'BaseActor2D', 'BaseGrid', 'BaseVolume', 'Bezier', 'Box', 'BoxCutter',
+    'Brace', 'Button', 'CSpline', 'Circle', 'Cone', 'ConvexHull', 'CornerAnnotation',
+    'Cross3D', 'Cube', 'Cylinder', 'DashedLine', 'Disc', 'DistanceTool', 'Earth',
+    'Ellipsoid', 'Flagpost', 'FlatArrow', 'GeoCircle', 'Glyph', 'Goniometer', 'Grid',
+    'Group', 'Hyperboloid', 'IcoSphere', 'Icon', 'KSpline', 'Latex', 'LegendBox',
+    'Light', 'Line', 'Lines', 'Marker', 'Mesh', 'NormalLines', 'OperationNode',
+    'Paraboloid', 'ParametricShape', 'Picture', 'Picture2D', 'Plane', 'PlaneCutter',
+    'Plotter', 'Point', 'Points', 'Polygon', 'ProgressBar', 'ProgressBarWidget',
+    'Pyramid', 'Rectangle', 'RendererFrame', 'Ribbon', 'RoundedLine', 'Ruler',
+    'Ruler2D', 'RulerAxes', 'ScalarBar', 'ScalarBar3D', 'Settings', 'Slider2D',
+    'Slider3D', 'Sphere', 'SphereCutter', 'Spheres', 'Spline', 'SplineTool', 'Spring',
+    'Star', 'Star3D', 'StreamLines', 'Tensors', 'TessellatedBox', 'TetMesh', 'Text2D',
+    'Text3D', 'TextBase', 'ThickTube', 'Torus', 'Triangle', 'Tube', 'UGrid', 'VedoLogo',
+    'Video', 'Volume', 'VolumeSlice', 'addons', 'applications', 'ask', 'assembly',
+    'backends', 'base', 'build_lut', 'build_palette', 'camera_from_neuroglancer',
+    'camera_from_quaternion', 'cart2cyl', 'cart2pol', 'cart2spher', 'close', 'closest',
+    'color_map', 'colors', 'cos', 'cross', 'cyl2cart', 'cyl2spher', 'dataurl',
+    'delaunay2d', 'delaunay3d', 'dot', 'download', 'exp', 'export_window',
+    'extract_cells_by_type', 'file_io', 'fit_circle', 'fit_line', 'fit_plane',
+    'fit_sphere', 'fonts', 'fonts_path', 'geometry', 'get_color', 'get_color_name',
+    'get_uv', 'grep', 'gunzip', 'humansort', 'import_window', 'installdir',
+    'interactor_modes', 'is_sequence', 'last_figure', 'lin_interpolate', 'load',
+    'loadRectilinearGrid', 'loadStructuredGrid', 'loadStructuredPoints',
+    'loadUnStructuredGrid', 'load_transform', 'log', 'logger', 'logging', 'mag', 'mag2',
+    'make_bands', 'merge', 'mesh', 'meshlab2vedo', 'notebook_backend',
+    'notebook_plotter', 'np', 'numpy2vtk', 'open3d2vedo', 'oriented_camera', 'os',
+    'pack_spheres', 'pca_ellipse', 'pca_ellipsoid', 'picture', 'platform', 'plotter',
+    'plotter_instance', 'point_in_triangle', 'point_line_distance', 'pointcloud',
+    'pol2cart', 'precision', 'print_histogram', 'print_info', 'printc', 'printd',
+    'probe_line', 'probe_plane', 'probe_points', 'procrustes_alignment', 'progressbar',
+    'pyplot', 'round_to_digit', 'screenshot', 'settings', 'shapes', 'show', 'sin',
+    'spher2cart', 'spher2cyl', 'sqrt', 'sys', 'sys_platform', 'tetmesh', 'trimesh2vedo',
+    'ugrid', 'utils', 'vector', 'vedo2meshlab', 'vedo2open3d', 'vedo2trimesh',
+    'version', 'versor', 'visible_points', 'volume', 'voronoi', 'vtk2numpy',
+    'vtkVersion', 'vtk_version', 'vtkclasses', 'write', 'write_transform'
+]
+
+for name in BASELINE_NAMES:
+    assert name in dir(vedo), name
+    getattr(vedo, name)  # raises AttributeError if it cannot be resolved
+print("resolved", len(BASELINE_NAMES), "names")
+
+for name in vedo._SUBMODULES:
+    assert name in vedo.__all__, name
+    if name != "settings":  # the Settings instance shadows the submodule
+        assert isinstance(getattr(vedo, name), types.ModuleType), name
+assert isinstance(vedo.settings, vedo.Settings)
+
+assert len(vedo.__all__) == len(set(vedo.__all__))
+ns = {}
+exec("from vedo import *", ns)
+for name in ("pyplot", "backends", "vtkclasses", "applications", "Mesh", "show", "np"):
+    assert name in ns, name
+# every public name that a star import gave before __all__ existed
+for name in BASELINE_NAMES:
+    assert name in ns, name
+
+try:
+    vedo.no_such_name
+except AttributeError:
+    pass
+else:
+    assert False
@@ -13,10 +13,7 @@
 import os
 import sys
 import logging
-import numpy as np
-from numpy import sin, cos, sqrt, exp, log, dot, cross  # just because handy
-
-from vtkmodules.vtkCommonCore import vtkVersion
+import importlib as _importlib
 
 #################################################
 from vedo.version import _version as __version__
@@ -24,29 +21,146 @@ from vedo.version import _version as __version__
 from vedo.settings import Settings
 settings = Settings(level=0)
 
-from vedo.colors import *
-from vedo.utils import *
-from vedo.base import *
-from vedo.shapes import *
-from vedo.file_io import *
-from vedo.ugrid import *
-from vedo.assembly import *
-from vedo.pointcloud import *
-from vedo.mesh import *
-from vedo.picture import *
-from vedo.volume import *
-from vedo.tetmesh import *
-from vedo.addons import *
-from vedo.plotter import *
-
-from vedo import applications
-from vedo import interactor_modes
+############################################## lazily loaded public interface
+# Names are resolved on first access through the module level __getattr__
+# (PEP 562), so that `import vedo` does not need to import every submodule.
+_SUBMODULES = (
+    "version", "settings", "vtkclasses", "colors", "utils", "base", "shapes",
+    "file_io", "ugrid", "assembly", "pointcloud", "mesh", "picture", "volume",
+    "tetmesh", "addons", "plotter", "pyplot", "backends", "applications",
+    "interactor_modes",
+)
+
+_DISPATCH = {}
+for _modname, _names in (
+    ("vedo.colors", (
+        "printc", "printd", "get_color", "get_color_name", "color_map",
+        "build_palette", "build_lut",
+    )),
+    ("vedo.utils", (
+        "OperationNode", "ProgressBar", "progressbar", "geometry",
+        "extract_cells_by_type", "is_sequence", "lin_interpolate", "vector", "mag",
+        "mag2", "versor", "precision", "round_to_digit", "point_in_triangle",
+        "point_line_distance", "closest", "grep", "print_info", "make_bands",
+        "pack_spheres", "spher2cart", "cart2spher", "cart2cyl", "cyl2cart",
+        "cyl2spher", "spher2cyl", "cart2pol", "pol2cart", "humansort",
+        "print_histogram", "camera_from_quaternion", "camera_from_neuroglancer",
+        "oriented_camera", "vedo2trimesh", "trimesh2vedo", "vedo2meshlab",
+        "meshlab2vedo", "vedo2open3d", "open3d2vedo", "vtk2numpy", "numpy2vtk",
+        "get_uv",
+    )),
+    ("vedo.base", (
+        "Base3DProp", "BaseActor", "BaseActor2D", "BaseGrid", "probe_points",
+        "probe_line", "probe_plane",
+    )),
+    ("vedo.shapes", (
+        "Marker", "Line", "DashedLine", "RoundedLine", "Tube", "ThickTube", "Lines",
+        "Spline", "KSpline", "CSpline", "Bezier", "Brace", "NormalLines",
+        "StreamLines", "Ribbon", "Arrow", "Arrows", "Arrow2D", "Arrows2D",
+        "FlatArrow", "Polygon", "Triangle", "Rectangle", "Disc", "Circle",
+        "GeoCircle", "Arc", "Star", "Star3D", "Cross3D", "IcoSphere", "Sphere",
+        "Spheres", "Earth", "Ellipsoid", "Grid", "TessellatedBox", "Plane", "Box",
+        "Cube", "Spring", "Cylinder", "Cone", "Pyramid", "Torus", "Paraboloid",
+        "Hyperboloid", "TextBase", "Text3D", "Text2D", "CornerAnnotation", "Latex",
+        "Glyph", "Tensors", "ParametricShape", "ConvexHull", "VedoLogo",
+    )),
+    ("vedo.file_io", (
+        "load", "download", "gunzip", "loadStructuredPoints", "loadStructuredGrid",
+        "loadRectilinearGrid", "loadUnStructuredGrid", "load_transform",
+        "write_transform", "write", "export_window", "import_window", "screenshot",
+        "ask", "Video",
+    )),
+    ("vedo.ugrid", (
+        "UGrid",
+    )),
+    ("vedo.assembly", (
+        "Group", "Assembly", "procrustes_alignment",
+    )),
+    ("vedo.pointcloud", (
+        "Points", "Point", "merge", "visible_points", "delaunay2d", "voronoi",
+        "fit_line", "fit_circle", "fit_plane", "fit_sphere", "pca_ellipse",
+        "pca_ellipsoid",
+    )),
+    ("vedo.mesh", (
+        "Mesh",
+    )),
+    ("vedo.picture", (
+        "Picture", "Picture2D",
+    )),
+    ("vedo.volume", (
+        "BaseVolume", "Volume", "VolumeSlice",
+    )),
+    ("vedo.tetmesh", (
+        "TetMesh", "delaunay3d",
+    )),
+    ("vedo.addons", (
+        "ScalarBar", "ScalarBar3D", "Slider2D", "Slider3D", "Icon", "LegendBox",
+        "Light", "Axes", "RendererFrame", "Ruler", "RulerAxes", "Ruler2D",
+        "DistanceTool", "SplineTool", "Goniometer", "Button", "Flagpost",
+        "ProgressBarWidget", "BoxCutter", "PlaneCutter", "SphereCutter",
+    )),
+    ("vedo.plotter", (
+        "Plotter", "show", "close",
+    )),
+):
+    for _name in _names:
+        _DISPATCH[_name] = _modname
+del _modname, _names, _name
+
+# numpy functions re-exported just because handy
+_NUMPY_REEXPORTS = ("sin", "cos", "sqrt", "exp", "log", "dot", "cross")
+
+
+def __getattr__(name):
+    modname = _DISPATCH.get(name)
+    if modname is not None:
+        value = getattr(_importlib.import_module(modname), name)
+    elif name in _SUBMODULES:
+        value = _importlib.import_module("vedo." + name)
+    elif name == "np":
+        value = _importlib.import_module("numpy")
+    elif name in _NUMPY_REEXPORTS:
+        value = getattr(_importlib.import_module("numpy"), name)
+    elif name == "vtkVersion":
+        from vtkmodules.vtkCommonCore import vtkVersion as value
+    elif name == "vtk_version":
+        from vtkmodules.vtkCommonCore import vtkVersion
+        vv = vtkVersion()
+        value = (
+            int(vv.GetVTKMajorVersion()),
+            int(vv.GetVTKMinorVersion()),
+            int(vv.GetVTKBuildVersion()),
+        )
+    elif name == "sys_platform":
+        import platform
+        value = platform.system()
+    elif name == "platform":
+        value = _importlib.import_module("platform")
+    else:
+        raise AttributeError(f"module 'vedo' has no attribute '{name}'")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(
+        set(globals()) | set(_DISPATCH) | set(_SUBMODULES) | set(_NUMPY_REEXPORTS)
+        | {"np", "vtk_version", "vtkVersion", "sys_platform", "platform"}
+    )
+
+
+# dict.fromkeys drops the repeated names (e.g. "settings") keeping the order
+__all__ = tuple(dict.fromkeys((
+    "np", *_NUMPY_REEXPORTS,
+    "settings", "Settings", "logger",
+    "vtk_version", "installdir", "dataurl", "fonts_path", "fonts",
+    "plotter_instance", "notebook_plotter", "notebook_backend", "last_figure",
+    # kept for scripts relying on `from vedo import *` as it was before __all__
+    "vtkVersion", "sys_platform", "platform", "os", "sys", "logging",
+    *_SUBMODULES,
+    *_DISPATCH,
+)))
 
-try:
-    import platform
-    sys_platform = platform.system()
-except (ModuleNotFoundError, AttributeError) as e:
-    sys_platform = ""
 
 ######################################################################### GLOBALS
 __author__     = "Marco Musy"
@@ -57,13 +171,7 @@ __website__    = "https://github.com/marcomusy/vedo"
 
 
 ##########################################################################
-vtk_version = (
-    int(vtkVersion().GetVTKMajorVersion()),
-    int(vtkVersion().GetVTKMinorVersion()),
-    int(vtkVersion().GetVTKBuildVersion()),
-)
-
-installdir = os.path.dirname(__file__)
+installdir = os.path.dirname(os.path.abspath(__file__))
 dataurl = "https://vedo.embl.es/examples/data/"
 
 plotter_instance = None
@@ -71,17 +179,22 @@ notebook_plotter = None
 notebook_backend = None
 
 ## fonts
-fonts_path = os.path.join(installdir, "fonts/")
+fonts_path = os.path.join(installdir, "fonts") + os.sep
 
 # Note:
 # a fatal error occurs when compiling to exe,
 # developer needs to copy the fonts folder to the same location as the exe file
 # to solve this problem
 if not os.path.exists(fonts_path):
-    fonts_path = "fonts/"
+    fonts_path = "fonts" + os.sep
 
-fonts = [_f.split(".")[0] for _f in os.listdir(fonts_path) if '.npz' not in _f]
-fonts = list(sorted(fonts))
+# installed packages carry the list of fonts written by setup.py at build time,
+# source checkouts have no manifest and the fonts folder is the source of truth
+try:
+    from vedo._fonts_manifest import FONTS as fonts
+except ImportError:
+    fonts = [_f.partition(".")[0] for _f in os.listdir(fonts_path) if not _f.endswith(".npz")]
+fonts = tuple(sorted(fonts, key=str.lower))
 
 # pyplot module to remember last figure format
 last_figure = None
@@ -107,22 +220,68 @@ class _LoggingCustomFormatter(logging.Formatter):
         logging.CRITICAL: inv_red + logformat + reset,
     }
 
+    def __init__(self):
+        super().__init__()
+        self._formatters = {
+            lvl: logging.Formatter(fmt) for lvl, fmt in self.FORMATS.items()
+        }
+        self._default_formatter = logging.Formatter()
+        # standard levels are multiples of 10, index them by levelno // 10
+        self._fmt_table = tuple(
+            self._formatters.get(lvl, self._default_formatter)
+            for lvl in (0, 10, 20, 30, 40, 50)
+        )
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
+        idx = record.levelno // 10
+        if 0 <= idx < 6:
+            formatter = self._fmt_table[idx]
+        else:
+            formatter = self._default_formatter
         return formatter.format(record).replace(".py", "")
 
+class _VedoStreamHandler(logging.StreamHandler):
+
+    flush_every = 32
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._since_flush = 0
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        # coalesce flushes, but never hold back warnings and errors
+        self._since_flush += 1
+        if record.levelno >= logging.WARNING or self._since_flush >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        sys.stdout.flush()
+        super().flush()
+        self._since_flush = 0
+
 logger = logging.getLogger("vedo")
 
-_chsh = logging.StreamHandler()
-_chsh.flush = sys.stdout.flush
-_chsh.setLevel(logging.DEBUG)
-_chsh.setFormatter(_LoggingCustomFormatter())
-logger.addHandler(_chsh)
-logger.setLevel(logging.INFO)
+# install the handlers only once, importlib.reload(vedo) re-runs this module
+# in the same namespace and would otherwise print every message twice
+if not globals().get("_vedo_initialized", False):
+    _chsh = _VedoStreamHandler()
+    _chsh.setLevel(logging.DEBUG)
+    _chsh.setFormatter(_LoggingCustomFormatter())
+    logger.addHandler(_chsh)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False  # vedo owns its handler, skip the root logger
+
+    _vedo_initialized = True
+
 
 ################################################# silence annoying messages
 # import warnings
+# import numpy as np
 # warnings.simplefilter(action="ignore", category=FutureWarning)
 # try:
 #     np.warnings.filterwarnings('ignore', category=np.VisibleDeprecationWarning)
@@ -2,13 +2,21 @@
 # -*- coding: utf-8 -*-
 import time
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from typing import Callable
 
 import numpy as np
 
+try:
+    import vedo.vtkclasses as vtk
+except ImportError:
+    import vtkmodules.all as vtk
+
 import vedo
-from vedo.colors import color_map, get_color
-from vedo.utils import is_sequence, lin_interpolate, mag, precision
+from vedo.colors import get_color
+from vedo.utils import is_sequence, precision
 from vedo.plotter import Event, Plotter
 from vedo.pointcloud import fit_plane, Points
 from vedo.shapes import Line, Ribbon, Spline, Text2D
@@ -37,6 +45,72 @@ __all__ = [
 ]
 
 
+def _subsample_for_hist(arr, nmax=1_000_000):
+    # an approximate histogram is enough for display purposes,
+    # counts taken on the sample must be multiplied by the returned stride
+    arr = np.asarray(arr).ravel()
+    step = max(1, -(-arr.size // nmax))  # ceil, so that at most nmax values are kept
+    return np.ascontiguousarray(arr[::step], dtype=np.float32), step
+
+
+def _corner_histogram(sample, step, vrange, **kwargs):
+    # a known range lets np.histogram skip its own min/max pass over the data,
+    # each sampled value weighs step so that the counts are those of the full data
+    weights = np.full(sample.size, step) if step > 1 else None
+    return CornerHistogram(sample, vrange=vrange, weights=weights, **kwargs)
+
+
+def _dataset2bytes(dataset):
+    # legacy binary vtk format, used to ship datasets to worker processes
+    writer = vtk.vtkDataSetWriter()
+    writer.SetInputData(dataset)
+    writer.SetFileTypeToBinary()
+    writer.WriteToOutputStringOn()
+    writer.Write()
+    return writer.GetOutputStdString()
+
+
+def _bytes2dataset(bstring):
+    reader = vtk.vtkDataSetReader()
+    reader.ReadFromInputStringOn()
+    reader.SetBinaryInputString(bstring, len(bstring))
+    reader.Update()
+    return reader.GetOutput()
+
+
+_iso_worker_volume = None
+
+
+def _iso_worker_init(volume_bytes):
+    # the volume is sent once per worker process, not once per isovalue
+    global _iso_worker_volume
+    img = vtk.vtkImageData()  # the legacy reader returns a vtkStructuredPoints
+    img.ShallowCopy(_bytes2dataset(volume_bytes))
+    _iso_worker_volume = vedo.Volume(img)
+
+
+def _iso_worker(value, lego):
+    if lego:
+        mesh = _iso_worker_volume.legosurface(vmin=value)
+    else:
+        mesh = _iso_worker_volume.isosurface(value)
+    return _dataset2bytes(mesh.polydata())
+
+
+def _style_isosurface(mesh, lego, scrange, c, alpha, cmap):
+    # the look of Volume.isosurface()/legosurface() plus the browser colors, applied in
+    # the same way to the meshes built here and to the ones rebuilt from a worker process
+    if lego:
+        mesh.lw(0.1).flat()
+        if mesh.ncells:
+            mesh.celldata.select("input_scalars")
+            mesh.cmap(cmap, vmin=scrange[0], vmax=scrange[1], on="cells")
+    else:
+        mesh.phong().color(c).alpha(alpha)
+        mesh.mapper().SetScalarRange(scrange[0], scrange[1])
+    return mesh
+
+
 #################################
 class Slicer3DPlotter(Plotter):
     """
@@ -96,18 +170,25 @@ class Slicer3DPlotter(Plotter):
         self.add(box)
 
         if show_icon:
-            self.add_inset(volume, pos=(0.85, 0.85), size=0.15, c="w", draggable=draggable)
+            self.add_inset(
+                volume, pos=(0.85, 0.85), size=0.15, c="w", draggable=draggable, at=at
+            )
 
         # inits
         la, ld = 0.7, 0.3  # ambient, diffuse
         dims = volume.dimensions()
-        data = volume.pointdata[0]
         rmin, rmax = volume.scalar_range()
+        if clamp or show_histo:
+            # one strided float32 sample serves both the clamp statistics and the histogram
+            sample, step = _subsample_for_hist(volume.pointdata[0])
         if clamp:
-            hdata, edg = np.histogram(data, bins=50)
+            # the sample is enough to locate the bulk of the values,
+            # the scalar range is already known so numpy can skip its min/max pass
+            hdata, edg = np.histogram(sample, bins=50, range=(rmin, rmax))
+            hdata *= step
             logdata = np.log(hdata + 1)
             # mean  of the logscale plot
-            meanlog = np.sum(np.multiply(edg[:-1], logdata)) / np.sum(logdata)
+            meanlog = (edg[:-1] @ logdata) / np.sum(logdata)
             rmax = min(rmax, meanlog + (meanlog - rmin) * 0.9)
             rmin = max(rmin, meanlog - (rmax - meanlog) * 0.9)
             # print("scalar range clamped to range: ("
@@ -117,52 +198,59 @@ class Slicer3DPlotter(Plotter):
         msh = volume.zslice(int(dims[2] / 2)).lighting("", la, ld, 0)
         msh.name = "ZSlice"
         msh.cmap(self._cmap_slicer, vmin=rmin, vmax=rmax)
+        self._scalarbar = None
         if len(cmaps) > 1:
             msh.add_scalarbar(pos=(0.04, 0.0), horizontal=True, font_size=0)
             msh.scalarbar.name = "scalarbar"    
+            self._scalarbar = msh.scalarbar  # shared by all slices, recolored in place
         # self.add(msh.clone()) # BUG
         self.add(msh)
+        # one persistent mesh per axis, its data is swapped in place by the sliders
+        self._slice_actors = {"z": msh}
 
         self._oldi = None
         self._oldj = None
         self._oldk = None
 
+        slicers = {"x": volume.xslice, "y": volume.yslice, "z": volume.zslice}
+
+        def swap_slice(axis, i, n):
+            msh = self._slice_actors.get(axis)
+            if not 0 < i < n:
+                if msh:
+                    msh.off()
+                return
+            new = slicers[axis](i)
+            if msh is None:
+                msh = new.lighting("", la, ld, 0)
+                msh.name = axis.upper() + "Slice"
+                self._slice_actors[axis] = msh
+                self.add(msh)
+            else:
+                msh._update(new.polydata(False))
+                msh.on()
+            msh.cmap(self._cmap_slicer, vmin=rmin, vmax=rmax)
 
         def slider_function_x(widget, event):
             i = int(self.xslider.value)
             if i == self._oldi:
                 return
             self._oldi = i
-            msh = volume.xslice(i).lighting("", la, ld, 0)
-            msh.cmap(self._cmap_slicer, vmin=rmin, vmax=rmax)
-            msh.name = "XSlice"
-            self.remove("XSlice")  # removes the old one
-            if 0 < i < dims[0]:
-                self.add(msh)
+            swap_slice("x", i, dims[0])
 
         def slider_function_y(widget, event):
             j = int(self.yslider.value)
             if j == self._oldj:
                 return
             self._oldj = j
-            msh = volume.yslice(j).lighting("", la, ld, 0)
-            msh.cmap(self._cmap_slicer, vmin=rmin, vmax=rmax)
-            msh.name = "YSlice"
-            self.remove("YSlice")
-            if 0 < j < dims[1]:
-                self.add(msh)
+            swap_slice("y", j, dims[1])
 
         def slider_function_z(widget, event):
             k = int(self.zslider.value)
             if k == self._oldk:
                 return
             self._oldk = k
-            msh = volume.zslice(k).lighting("", la, ld, 0)
-            msh.cmap(self._cmap_slicer, vmin=rmin, vmax=rmax)
-            msh.name = "ZSlice"
-            self.remove("ZSlice")
-            if 0 < k < dims[2]:
-                self.add(msh)
+            swap_slice("z", k, dims[2])
 
         if not use_slider3d:
             self.xslider = self.add_slider(
@@ -173,6 +261,7 @@ class Slicer3DPlotter(Plotter):
                 title_size=0.5,
                 pos=[(0.8, 0.12), (0.95, 0.12)],
                 show_value=False,
+                delayed=True,
                 c=cx,
             )
             self.yslider = self.add_slider(
@@ -183,6 +272,7 @@ class Slicer3DPlotter(Plotter):
                 title_size=0.5,
                 pos=[(0.8, 0.08), (0.95, 0.08)],
                 show_value=False,
+                delayed=True,
                 c=cy,
             )
             self.zslider = self.add_slider(
@@ -194,17 +284,20 @@ class Slicer3DPlotter(Plotter):
                 value=int(dims[2] / 2),
                 pos=[(0.8, 0.04), (0.95, 0.04)],
                 show_value=False,
+                delayed=True,
                 c=cz,
             )
         else:  # 3d sliders attached to the axes bounds
             bs = box.bounds()
+            dx, dy, dz = bs[1] - bs[0], bs[3] - bs[2], bs[5] - bs[4]
+            diag = np.sqrt(dx * dx + dy * dy + dz * dz)  # same as box.diagonal_size()
             self.xslider = self.add_slider3d(
                 slider_function_x,
                 pos1=(bs[0], bs[2], bs[4]),
                 pos2=(bs[1], bs[2], bs[4]),
                 xmin=0,
                 xmax=dims[0],
-                t=box.diagonal_size() / mag(box.xbounds()) * 0.6,
+                t=diag / np.hypot(bs[0], bs[1]) * 0.6,
                 c=cx,
                 show_value=False,
             )
@@ -214,7 +307,7 @@ class Slicer3DPlotter(Plotter):
                 pos2=(bs[1], bs[3], bs[4]),
                 xmin=0,
                 xmax=dims[1],
-                t=box.diagonal_size() / mag(box.ybounds()) * 0.6,
+                t=diag / np.hypot(bs[2], bs[3]) * 0.6,
                 c=cy,
                 show_value=False,
             )
@@ -225,7 +318,7 @@ class Slicer3DPlotter(Plotter):
                 xmin=0,
                 xmax=dims[2],
                 value=int(dims[2] / 2),
-                t=box.diagonal_size() / mag(box.zbounds()) * 0.6,
+                t=diag / np.hypot(bs[4], bs[5]) * 0.6,
                 c=cz,
                 show_value=False,
             )
@@ -234,19 +327,17 @@ class Slicer3DPlotter(Plotter):
         def buttonfunc(evt):
             if evt.actor and evt.actor.name == bu.name:
                 bu.switch()
+                if bu.status() == self._cmap_slicer:
+                    return
                 self._cmap_slicer = bu.status()
-                for m in self.actors:
-                    try:
-                        if "Slice" in m.name:
-                            m.cmap(self._cmap_slicer, vmin=rmin, vmax=rmax)
-                            if len(cmaps) > 1:
-                                self.remove("scalarbar")
-                                m2 = m.clone()
-                                m2.add_scalarbar(pos=(0.04, 0.0), horizontal=True, font_size=0)
-                                m2.scalarbar.name = "scalarbar"
-                                self.add(m2.scalarbar)
-                    except AttributeError:
-                        pass
+                for m in self._slice_actors.values():
+                    m.cmap(self._cmap_slicer, vmin=rmin, vmax=rmax)
+                if self._scalarbar:
+                    # the scalarbar is the same for all slices, just point it to the new lut
+                    m = self._slice_actors["z"]
+                    lut = m.inputdata().GetPointData().GetScalars().GetLookupTable()
+                    self._scalarbar.SetLookupTable(lut)
+                    self._scalarbar.Modified()
                 self.render()
 
         if len(cmaps) > 1:
@@ -263,11 +354,11 @@ class Slicer3DPlotter(Plotter):
 
         #################
         if show_histo:
-            hist = CornerHistogram(
-                data, s=0.2, bins=25, logscale=True,
+            hist = _corner_histogram(
+                sample, step, volume.scalar_range(), s=0.2, bins=25, logscale=True,
                 pos=(0.02, 0.02), c=ch, bg=ch, alpha=0.7
             )
-            self.add(hist)
+            self.add(hist, at=at)
 
 
 ########################################################################################
@@ -337,9 +428,12 @@ class Slicer2DPlotter(Plotter):
             #     bg="k",
             #     alpha=1,
             # )
+            sample, step = _subsample_for_hist(volume.pointdata[0])
             hist = vedo.pyplot.histogram(
-                volume.pointdata[0],
+                sample,
+                weights=np.full(sample.size, step),  # counts of the full data
                 bins=10,
+                xlim=tuple(volume.scalar_range()),  # known, no min/max pass needed
                 logscale=True,
                 c=histo_color,
                 ytitle="log_10 (counts)",
@@ -408,10 +502,6 @@ class RayCastPlotter(Plotter):
             "coolwarm",
             "tab10",
         ]
-        cols_cmaps = []
-        for cm in cmaps:
-            cols = color_map(range(0, 21), cm, 0, 20)  # sample 20 colors
-            cols_cmaps.append(cols)
         Ncols = len(cmaps)
         csl = (0.9, 0.9, 0.9)
         if sum(get_color(self.renderer.GetBackground())) > 1.5:
@@ -440,18 +530,25 @@ class RayCastPlotter(Plotter):
         opacityTransferFunction = self.property.GetScalarOpacity()
 
         def setOTF():
-            opacityTransferFunction.RemoveAllPoints()
-            opacityTransferFunction.AddPoint(smin, 0.0)
-            opacityTransferFunction.AddPoint(smin + (smax - smin) * 0.1, 0.0)
-            opacityTransferFunction.AddPoint(x0alpha, self.alphaslider0)
-            opacityTransferFunction.AddPoint(x1alpha, self.alphaslider1)
-            opacityTransferFunction.AddPoint(x2alpha, self.alphaslider2)
+            # (x, opacity) pairs, loaded in one call (replaces the existing nodes)
+            otf_pts = np.array(
+                [
+                    smin, 0.0,
+                    smin + (smax - smin) * 0.1, 0.0,
+                    x0alpha, self.alphaslider0,
+                    x1alpha, self.alphaslider1,
+                    x2alpha, self.alphaslider2,
+                ],
+                dtype=np.float64,
+            )
+            opacityTransferFunction.FillFromDataPointer(5, otf_pts)
 
         setOTF()
 
+        # AddPoint() at an existing x only updates the opacity of that node
         def sliderA0(widget, event):
             self.alphaslider0 = widget.GetRepresentation().GetValue()
-            setOTF()
+            opacityTransferFunction.AddPoint(x0alpha, self.alphaslider0)
 
         self.add_slider(
             sliderA0,
@@ -465,7 +562,7 @@ class RayCastPlotter(Plotter):
 
         def sliderA1(widget, event):
             self.alphaslider1 = widget.GetRepresentation().GetValue()
-            setOTF()
+            opacityTransferFunction.AddPoint(x1alpha, self.alphaslider1)
 
         self.add_slider(
             sliderA1,
@@ -479,7 +576,7 @@ class RayCastPlotter(Plotter):
 
         def sliderA2(widget, event):
             self.alphaslider2 = widget.GetRepresentation().GetValue()
-            setOTF()
+            opacityTransferFunction.AddPoint(x2alpha, self.alphaslider2)
 
         w2 = self.add_slider(
             sliderA2,
@@ -494,11 +591,12 @@ class RayCastPlotter(Plotter):
         w2.GetRepresentation().SetTitleHeight(0.016)
 
         # add a button
+        self._mode = volume.mode()  # tracked here, the button is the only one changing it
+
         def button_func_mode(evt):
             if evt.actor and evt.actor.name == bum.name:
-                s = volume.mode()
-                snew = (s + 1) % 2
-                volume.mode(snew)
+                self._mode = (self._mode + 1) % 2
+                volume.mode(self._mode)
                 bum.switch()
 
         bum = self.add_button(
@@ -514,11 +612,13 @@ class RayCastPlotter(Plotter):
             name="raycast_button",
         )
         bum.frame(c='w')
-        bum.status(volume.mode())
+        bum.status(self._mode)
 
         # add histogram of scalar
-        plot = CornerHistogram(
-            volume,
+        scalars = vedo.utils.vtk2numpy(img.GetPointData().GetScalars())  # the active ones
+        plot = _corner_histogram(
+            *_subsample_for_hist(scalars, nmax=3_141_500),  # otherwise too slow
+            (smin, smax),
             bins=25,
             logscale=1,
             c=(0.7, 0.7, 0.7),
@@ -526,7 +626,6 @@ class RayCastPlotter(Plotter):
             pos=(0.78, 0.065),
             lines=True,
             dots=False,
-            nmax=3.1415e06,  # subsample otherwise is too slow
         )
 
         plot.GetPosition2Coordinate().SetValue(0.197, 0.20, 0)
@@ -563,6 +662,7 @@ class IsosurfaceBrowser(Plotter):
         bg2=None,
         axes=1,
         interactive=True,
+        nprocs=1,
     ):
         """
         Generate a `vedo.Plotter` for Volume isosurfacing using a slider.
@@ -574,6 +674,10 @@ class IsosurfaceBrowser(Plotter):
 
         Set `precompute=True` to precompute the isosurfaces (so slider browsing will be smoother).
 
+        Set `nprocs` to distribute the precomputation over several processes
+        (`nprocs=None` uses all available cores).
+        Scripts using it must be guarded by `if __name__ == "__main__":` on Windows and macOS.
+
         Examples:
             - [app_isobrowser.py](https://github.com/marcomusy/vedo/tree/master/examples/volumetric/app_isobrowser.py)
 
@@ -640,24 +744,52 @@ class IsosurfaceBrowser(Plotter):
                 slidertitle = "scalar value"
 
             allowed_vals = np.linspace(scrange[0], scrange[1], num=res)
+            self._inv_step = (res - 1) / delta  # to snap a value to its index
+
+            bacts = [None] * res  # cache the meshes by index so we dont need to recompute
+
+            def isosurface(value):
+                if lego:
+                    mesh = volume.legosurface(vmin=value)
+                else:
+                    mesh = volume.isosurface(value)
+                return _style_isosurface(mesh, lego, scrange, c, alpha, cmap)
 
-            bacts = {}  # cache the meshes so we dont need to recompute
             if precompute:
                 delayed = False  # no need to delay the slider in this case
                 if progress:
                     pb = vedo.ProgressBar(0, len(allowed_vals), delay=1)
 
-                for value in allowed_vals:
-                    value_name = precision(value, 2)
-                    if lego:
-                        mesh = volume.legosurface(vmin=value)
-                        if mesh.ncells:
-                            mesh.cmap(cmap, vmin=scrange[0], vmax=scrange[1], on="cells")
-                    else:
-                        mesh = volume.isosurface(value).color(c).alpha(alpha)
-                    bacts.update({value_name: mesh})  # store it
-                    if progress:
-                        pb.print("isosurfacing volume..")
+                if nprocs is None:
+                    nprocs = os.cpu_count()
+
+                if nprocs > 1:
+                    # each isovalue is independent: compute them in parallel and
+                    # rebuild the meshes here from the returned polydata
+                    with ProcessPoolExecutor(
+                        max_workers=min(nprocs, res),
+                        initializer=_iso_worker_init,
+                        initargs=(_dataset2bytes(volume.imagedata()),),
+                    ) as executor:
+                        results = executor.map(
+                            _iso_worker, allowed_vals, [lego] * len(allowed_vals)
+                        )
+                        for idx, bpoly in enumerate(results):
+                            mesh = _style_isosurface(
+                                vedo.Mesh(_bytes2dataset(bpoly)), lego, scrange, c, alpha, cmap
+                            )
+                            bacts[idx] = mesh  # store it
+                            self.renderer.AddActor(mesh.off())
+                            if progress:
+                                pb.print("isosurfacing volume..")
+
+                else:
+                    for idx, value in enumerate(allowed_vals):
+                        mesh = isosurface(value)
+                        bacts[idx] = mesh  # store it
+                        self.renderer.AddActor(mesh.off())
+                        if progress:
+                            pb.print("isosurfacing volume..")
 
             ### isovalue slider callback
             def slider_isovalue(widget, event):
@@ -668,30 +800,26 @@ class IsosurfaceBrowser(Plotter):
                 else:
                     value = widget.GetRepresentation().GetValue()
 
-                # snap to the closest
-                idx = (np.abs(allowed_vals - value)).argmin()
+                # snap to the closest, allowed_vals are evenly spaced
+                idx = int(round((value - scrange[0]) * self._inv_step))
+                idx = max(0, min(res - 1, idx))
                 value = allowed_vals[idx]
 
                 if abs(value - self._prev_value) / delta < 0.001:
                     return
                 self._prev_value = value
 
-                value_name = precision(value, 2)
-                if value_name in bacts:  # reusing the already existing mesh
-                    # print('reusing')
-                    mesh = bacts[value_name]
-                else:  # else generate it
+                mesh = bacts[idx]  # reuse the already existing mesh
+                if mesh is None:  # else generate it
                     # print('generating', value)
-                    if lego:
-                        mesh = volume.legosurface(vmin=value)
-                        if mesh.ncells:
-                            mesh.cmap(cmap, vmin=scrange[0], vmax=scrange[1], on="cells")
-                    else:
-                        mesh = volume.isosurface(value).color(c).alpha(alpha)
-                    bacts.update({value_name: mesh})  # store it
-
-                self.renderer.RemoveActor(prevact)
-                self.renderer.AddActor(mesh)
+                    mesh = isosurface(value)
+                    bacts[idx] = mesh  # store it
+                    self.renderer.AddActor(mesh)
+
+                # all meshes stay in the renderer, only their visibility is toggled
+                if prevact is not None:
+                    prevact.off()
+                mesh.on()
                 self.actors[0] = mesh
 
             ################################################
@@ -766,32 +894,48 @@ class Browser(Plotter):
             objects = [objects]
 
         self.slider = None
+        self._slider_rep = None
         self.timer_callback_id = None
         self._oldk = None
+        self._shown = [None] * len(objects)  # index of the visible object per group
+        n = len(objects)
+        m = len(objects[0])
+        # keep the slots (the slider indexes them) but drop what cannot be toggled
+        self._toggleable = [
+            [ak if hasattr(ak, "on") and hasattr(ak, "off") else None for ak in group]
+            for group in objects
+        ]
+        toggleable = self._toggleable
 
         # define the slider func ##########################
         def slider_function(widget=None, event=None):
 
-            k = int(self.slider.value)
+            k = int(self._slider_rep.GetValue())
 
             if k == self._oldk:
                 return # no change
             self._oldk = k
 
-            n = len(objects)
-            m = len(objects[0])
             for i in range(n):
-                for j in range(m):
-                    ak = objects[i][j]
-                    try:
+                group = toggleable[i]
+                prev = self._shown[i]
+                if prev is None:  # first call: only the k-th object stays visible
+                    for j in range(m):
+                        ak = group[j]
+                        if ak is None:
+                            continue
                         if j == k:
                             ak.on()
-                            akon = ak
                         else:
                             ak.off()
-                    except AttributeError:
-                        pass
-            
+                else:  # just swap the previously shown object with the new one
+                    if group[prev] is not None:
+                        group[prev].off()
+                    if group[k] is not None:
+                        group[k].on()
+                self._shown[i] = k
+
+            akon = objects[0][k]
             try:
                 tx = str(k)
                 if slider_title:
@@ -800,7 +944,7 @@ class Browser(Plotter):
                     tx = akon.filename.split("/")[-1]
                     tx = tx.split("\\")[-1]  # windows os
                 elif akon.name:
-                    tx = ak.name + " " + tx
+                    tx = akon.name + " " + tx
             except:
                 pass
             self.slider.title = tx
@@ -820,7 +964,8 @@ class Browser(Plotter):
             c=c,
             show_value=False,
         )
-        self.slider.GetRepresentation().SetTitleHeight(0.020)
+        self._slider_rep = self.slider.GetRepresentation()
+        self._slider_rep.SetTitleHeight(0.020)
         slider_function()  # init call
     
     def play(self, dt=100):
@@ -904,7 +1049,8 @@ class FreeHandCutPlotter(Plotter):
         super().__init__(**options)
 
         self.mesh = mesh
-        self.mesh_prev = mesh
+        # undo history as (mesh, polydata) pairs, polydata is None if the whole mesh was replaced
+        self._undo_stack = []
         self.splined = splined
         self.linecolor = lc
         self.linewidth = lw
@@ -923,15 +1069,51 @@ class FreeHandCutPlotter(Plotter):
         self.idkeypress = self.add_callback("KeyPress", self._on_keypress)
         self.idrightclck = self.add_callback("RightButton", self._on_right_click)
         self.idmousemove = self.add_callback("MouseMove", self._on_mouse_move)
+        self.idtimer = self.add_callback("timer", self._on_timer)
+        self._last_render = 0.0
+        self._render_pending = False
+        self._render_timer_id = None
         self.drawmode = False
         self.tol = tol  # tolerance of point distance
+        self._update_tolerance()
         self.cpoints = []
         self.points = None
         self.spline = None
+        self._spline_npts = 0  # nr of points the current spline was fitted to
         self.jline = None
         self.topline = None
         self.top_pts = []
 
+    @property
+    def cpoints(self):
+        """The points drawn so far, as a numpy array of shape (n, 3)."""
+        return self._cbuf[: self._ncpoints]
+
+    @cpoints.setter
+    def cpoints(self, pts):
+        pts = np.asarray(pts, dtype=float)
+        n = len(pts)
+        self._cbuf = np.zeros((max(64, 2 * n), 3), dtype=float)
+        if n:
+            self._cbuf[:n, : pts.shape[1]] = pts  # 2d points get z=0
+        self._ncpoints = n
+
+    def _append_cpoint(self, p):
+        # contiguous buffer doubled when full, amortized O(1) appends
+        n = self._ncpoints
+        if n == len(self._cbuf):
+            buf = np.zeros((2 * n, 3), dtype=float)
+            buf[:n] = self._cbuf
+            self._cbuf = buf
+        self._cbuf[n] = p
+        self._ncpoints = n + 1
+
+    def _update_tolerance(self):
+        # cache the squared min distance between drawn points, it only depends on the mesh size
+        self._diag = self.mesh.diagonal_size()
+        self._tol_linear = self._diag * self.tol
+        self._tol_dist2 = self._tol_linear ** 2
+
     def init(self, init_points):
         """Set an initial number of points to define a region"""
         if isinstance(init_points, Points):
@@ -944,6 +1126,7 @@ class FreeHandCutPlotter(Plotter):
         else:
             self.spline = Line(self.cpoints)
         self.spline.lw(self.linewidth).c(self.linecolor).pickable(False)
+        self._spline_npts = len(self.cpoints)
         self.jline = Line(self.cpoints[0], self.cpoints[-1], lw=1, c=self.linecolor).pickable(0)
         self.add([self.points, self.spline, self.jline]).render()
         return self
@@ -961,32 +1144,123 @@ class FreeHandCutPlotter(Plotter):
                 else:
                     self.spline = Line(self.cpoints, closed=True)
                 self.spline.lw(self.linewidth).c(self.linecolor).pickable(False)
+                self._spline_npts = len(self.cpoints)
                 self.add(self.spline)
         self.render()
 
+    @staticmethod
+    def _append_vertex(pts_actor, p):
+        # extend a Points object in place instead of rebuilding it
+        poly = pts_actor.polydata(False)
+        vpts = poly.GetPoints()
+        pid = vpts.InsertNextPoint(p)
+        verts = poly.GetVerts()
+        verts.InsertNextCell(1)
+        verts.InsertCellPoint(pid)
+        vpts.Modified()
+        verts.Modified()
+
+    def _build_spline(self):
+        self.remove(self.spline)
+        if self.splined:
+            self.spline = Spline(self.cpoints, res=len(self.cpoints) * 4)  # not closed here
+        else:
+            self.spline = Line(self.cpoints)
+        self.spline.lw(self.linewidth).c(self.linecolor).pickable(False)
+        self._spline_npts = len(self.cpoints)
+        self.add(self.spline)
+
     def _on_mouse_move(self, evt):
         if self.drawmode:
             cpt = self.compute_world_coordinate(evt.picked2d)  # make this 2d-screen point 3d
-            if self.cpoints and mag(cpt - self.cpoints[-1]) < self.mesh.diagonal_size() * self.tol:
-                return  # new point is too close to the last one. skip
-            self.cpoints.append(cpt)
-            if len(self.cpoints) > 2:
-                self.remove([self.points, self.spline, self.jline, self.topline])
-                self.points = Points(self.cpoints, r=self.linewidth).c(self.pointcolor).pickable(0)
-                if self.splined:
-                    self.spline = Spline(self.cpoints, res=len(self.cpoints) * 4)  # not closed here
-                else:
-                    self.spline = Line(self.cpoints)
+            if len(self.cpoints):
+                # plain float arithmetic, no temporary arrays on this hot path
+                x, y, z = cpt.tolist()
+                x0, y0, z0 = self.cpoints[-1].tolist()
+                dx, dy, dz = x - x0, y - y0, z - z0
+                tl = self._tol_linear
+                # far along any axis means far, the full distance is only needed in the box
+                if -tl < dx < tl and -tl < dy < tl and -tl < dz < tl:
+                    if dx * dx + dy * dy + dz * dz < self._tol_dist2:
+                        return  # new point is too close to the last one. skip
+            self._append_cpoint(cpt)
+            if len(self.cpoints) < 3:
+                return
 
-                if evt.actor:
-                    self.top_pts.append(evt.picked3d)
+            if self.points is None:  # first points of the drawing, build the actors
+                self.remove([self.jline, self.topline])
+                self.points = Points(self.cpoints, r=self.linewidth).c(self.pointcolor).pickable(0)
+                self.jline = Line(self.cpoints[0], cpt, lw=1, c=self.linecolor).pickable(0)
+                self.add([self.points, self.jline])
+                self._build_spline()
+            else:  # only extend the existing ones
+                self._append_vertex(self.points, cpt)
+                self.jline.points([self.cpoints[0], cpt])
+                # the spline goes through all the points, refit it only every few of them
+                if len(self.cpoints) - self._spline_npts >= 8:
+                    self._build_spline()
+
+            if evt.actor:
+                self.top_pts.append(evt.picked3d)
+                if self.topline is None:
                     self.topline = Points(self.top_pts, r=self.linewidth)
                     self.topline.c(self.linecolor).pickable(False)
+                    self.add(self.topline)
+                else:
+                    self._append_vertex(self.topline, evt.picked3d)
+
+            self.txt2d.background(self.linecolor)
+            self._throttled_render()
+
+    def _throttled_render(self):
+        # mouse moves come faster than the display refresh: repaint at most every 16ms,
+        # a one shot timer takes care of showing the last update
+        now = time.monotonic()
+        if self.interactor and now - self._last_render < 0.016:
+            if not self._render_pending:
+                self._render_pending = True
+                self._render_timer_id = self.timer_callback("create", dt=16, one_shot=True)
+            return
+        self._last_render = now
+        self._render_pending = False
+        self.render()
 
-                self.spline.lw(self.linewidth).c(self.linecolor).pickable(False)
-                self.txt2d.background(self.linecolor)
-                self.jline = Line(self.cpoints[0], self.cpoints[-1], lw=1, c=self.linecolor).pickable(0)
-                self.add([self.points, self.spline, self.jline, self.topline]).render()
+    def _on_timer(self, evt):
+        if evt.timerid != self._render_timer_id:
+            return  # not the repaint timer
+        self._render_timer_id = None
+        if self._render_pending:
+            self._render_pending = False
+            self._last_render = time.monotonic()
+            self.render()
+
+    def _push_undo(self, mesh, poly):
+        if poly is not None:
+            snapshot = vtk.vtkPolyData()
+            snapshot.ShallowCopy(poly)
+            poly = snapshot
+        self._undo_stack.append((mesh, poly))
+        del self._undo_stack[:-5]  # keep only the last few steps
+
+    def _cut_with_loop(self, pts, invert=False):
+        # clip the mesh with the loop extruded along its normal, which is what the
+        # ribbon cut does, without computing the distance to a ribbon mesh
+        vpts = vtk.vtkPoints()
+        for p in pts:
+            vpts.InsertNextPoint(p)
+        loop = vtk.vtkImplicitSelectionLoop()
+        loop.SetLoop(vpts)
+        loop.AutomaticNormalGenerationOn()
+        tr = vtk.vtkTransform()  # the loop is in world coordinates
+        tr.SetMatrix(self.mesh.GetMatrix())
+        loop.SetTransform(tr)
+        clipper = vtk.vtkClipPolyData()
+        clipper.SetInputData(self.mesh.polydata(False))
+        clipper.SetClipFunction(loop)
+        clipper.SetInsideOut(not invert)
+        clipper.SetValue(0.0)
+        clipper.Update()
+        self.mesh._update(clipper.GetOutput())
 
     def _on_keypress(self, evt):
         if evt.keypress.lower() == "z" and self.spline:  # Cut mesh with a ribbon-like surface
@@ -995,12 +1269,20 @@ class FreeHandCutPlotter(Plotter):
                 inv = True
             self.txt2d.background("red8").text("  ... working ...  ")
             self.render()
-            self.mesh_prev = self.mesh.clone()
-            tol = self.mesh.diagonal_size() / 2  # size of ribbon (not shown)
+            if self.drawmode and self._spline_npts < len(self.cpoints):
+                self._build_spline()  # make sure the spline includes the latest points
+            # the cuts replace the polydata without modifying it, a reference is enough
+            self._push_undo(self.mesh, self.mesh.polydata(False))
             pts = self.spline.points()
-            n = fit_plane(pts, signed=True).normal  # compute normal vector to points
-            rb = Ribbon(pts - tol * n, pts + tol * n, closed=True)
-            self.mesh.cut_with_mesh(rb, invert=inv)  # CUT
+            plane = fit_plane(pts, signed=True)
+            n = plane.normal  # compute normal vector to points
+            if np.max(np.abs((pts - plane.center) @ n)) < 0.01 * self._diag:
+                self._cut_with_loop(pts, inv)  # the line is flat: cookie-cutter clip
+            else:
+                tol = self._diag / 2  # size of ribbon (not shown)
+                rb = Ribbon(pts - tol * n, pts + tol * n, closed=True)
+                self.mesh.cut_with_mesh(rb, invert=inv)  # CUT
+            self._update_tolerance()
             self.txt2d.text(self.msg)  # put back original message
             if self.drawmode:
                 self._on_right_click(evt)  # toggle mode to normal
@@ -1015,13 +1297,14 @@ class FreeHandCutPlotter(Plotter):
             self.txt2d.text(" ... removing smaller ... \n ... parts of the mesh ... ")
             self.render()
             self.remove(self.mesh)
-            self.mesh_prev = self.mesh
+            self._push_undo(self.mesh, None)
             mcut = self.mesh.extract_largest_region()
             mcut.filename = self.mesh.filename  # copy over various properties
             mcut.name = self.mesh.name
             mcut.scalarbar = self.mesh.scalarbar
             mcut.info = self.mesh.info
             self.mesh = mcut                            # discard old mesh by overwriting it
+            self._update_tolerance()
             self.txt2d.text(self.msg).background(self.color)   # put back original message
             self.add(mcut).render()
 
@@ -1031,7 +1314,11 @@ class FreeHandCutPlotter(Plotter):
             else:
                 self.txt2d.background(self.color, self.alpha)
             self.remove([self.mesh, self.spline, self.jline, self.points, self.topline])
-            self.mesh = self.mesh_prev
+            if self._undo_stack:
+                self.mesh, poly = self._undo_stack.pop()
+                if poly is not None:
+                    self.mesh._update(poly)
+                self._update_tolerance()
             self.cpoints, self.points, self.spline = [], None, None
             self.top_pts, self.topline = [], None
             self.add(self.mesh).render()
@@ -1094,7 +1381,7 @@ class SplinePlotter(Plotter):
         self.mode = "trackball"
         self.verbose = True
         self.splined = splined
-        self.resolution = None  # spline resolution (None = automatic)
+        self.resolution = None  # spline resolution (None = automatic, up to 500)
         self.closed = closed
         self.lcolor = "yellow4"
         self.lwidth = 3
@@ -1135,26 +1422,61 @@ class SplinePlotter(Plotter):
             self.cpoints = newpts
             self._update()
             return self
-        return np.array(self.cpoints)
+        return self.cpoints.copy()
+
+    @property
+    def cpoints(self):
+        """The clicked points, as a numpy array of shape (n, 3)."""
+        return self._cbuf[: self._ncpoints]
+
+    @cpoints.setter
+    def cpoints(self, pts):
+        pts = np.asarray(pts, dtype=float)
+        n = len(pts)
+        self._cbuf = np.zeros((max(128, 2 * n), 3), dtype=float)
+        if n:
+            self._cbuf[:n, : pts.shape[1]] = pts  # 2d points get z=0
+        self._ncpoints = n
+
+    def _append_cpoint(self, p):
+        # contiguous buffer doubled when full, amortized O(1) appends
+        n = self._ncpoints
+        if n == len(self._cbuf):
+            buf = np.zeros((2 * n, 3), dtype=float)
+            buf[:n] = self._cbuf
+            self._cbuf = buf
+        self._cbuf[n] = p
+        self._ncpoints = n + 1
+
+    def _pop_cpoint(self, i=-1):
+        n = self._ncpoints
+        if i < 0:
+            i += n
+        self._cbuf[i : n - 1] = self._cbuf[i + 1 : n]
+        self._ncpoints = n - 1
 
     def _on_left_click(self, evt):
         if not evt.actor:
             return
         if evt.actor.name == "points":
             # remove clicked point if clicked twice
-            pid = self.vpoints.closest_point(evt.picked3d, return_point_id=True)
-            self.cpoints.pop(pid)
+            if len(self.cpoints) > 32:  # tree search, the locator is cached on vpoints
+                pid = self.vpoints.closest_point(evt.picked3d, return_point_id=True)
+            else:  # for a few points a direct scan is cheaper than building a locator
+                d = self.vpoints.points(transformed=False) - evt.picked3d
+                pid = int(np.argmin((d * d).sum(axis=1)))
+            self._pop_cpoint(pid)
             self._update()
             return
         p = evt.picked3d
-        self.cpoints.append(p)
+        self._append_cpoint(p)
         self._update()
         if self.verbose:
             vedo.colors.printc("Added point:", precision(p, 4), c="g")
 
     def _on_right_click(self, evt):
         if evt.actor and len(self.cpoints) > 0:
-            self.cpoints.pop()  # pop removes from the list the last pt
+            self._pop_cpoint()  # remove the last pt
             self._update()
             if self.verbose:
                 vedo.colors.printc("Deleted last point", c="r")
@@ -1169,11 +1491,13 @@ class SplinePlotter(Plotter):
             minnr = 2
         if self.lwidth and len(self.cpoints) > minnr:
             if self.splined:
+                # the automatic resolution grows with the points, keep it bounded
+                res = self.resolution or min(10 * len(self.cpoints), 500)
                 try:
-                    self.line = Spline(self.cpoints, closed=self.closed, res=self.resolution)
+                    self.line = Spline(self.cpoints, closed=self.closed, res=res)
                 except ValueError:
                     # if clicking too close splining might fail
-                    self.cpoints.pop()
+                    self._pop_cpoint()
                     return
             else:
                 self.line = Line(self.cpoints, closed=self.closed)
@@ -1283,6 +1607,10 @@ class Animation(Plotter):
 
         return objs2, t, duration, rng
 
+    def _book(self, rng, action, acts, values):
+        # one event per time step, values[i] is the input at time rng[i]
+        self.events.extend(zip(rng.tolist(), repeat(action), repeat(acts), values))
+
     def switch_on(self, acts=None, t=None):
         """Switch on the input list of meshes."""
         return self.fade_in(acts, t, 0)
@@ -1295,9 +1623,7 @@ class Animation(Plotter):
         """Gradually switch on the input list of meshes by increasing opacity."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                alpha = lin_interpolate(tt, [t, t + duration], [0, 1])
-                self.events.append((tt, self.fade_in, acts, alpha))
+            self._book(rng, self.fade_in, acts, np.linspace(0, 1, len(rng)).tolist())
         else:
             for a in self._performers:
                 if hasattr(a, "alpha"):
@@ -1310,9 +1636,7 @@ class Animation(Plotter):
         """Gradually switch off the input list of meshes by increasing transparency."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                alpha = lin_interpolate(tt, [t, t + duration], [1, 0])
-                self.events.append((tt, self.fade_out, acts, alpha))
+            self._book(rng, self.fade_out, acts, np.linspace(1, 0, len(rng)).tolist())
         else:
             for a in self._performers:
                 if a.alpha() <= self._inputvalues:
@@ -1324,9 +1648,8 @@ class Animation(Plotter):
         """Gradually change transparency for the input list of meshes."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                alpha = lin_interpolate(tt, [t, t + duration], [alpha1, alpha2])
-                self.events.append((tt, self.fade_out, acts, alpha))
+            alphas = np.linspace(alpha1, alpha2, len(rng))
+            self._book(rng, self.fade_out, acts, alphas.tolist())
         else:
             for a in self._performers:
                 a.alpha(self._inputvalues)
@@ -1337,16 +1660,9 @@ class Animation(Plotter):
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
 
-            col2 = get_color(c)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    col1 = a.color()
-                    r = lin_interpolate(tt, [t, t + duration], [col1[0], col2[0]])
-                    g = lin_interpolate(tt, [t, t + duration], [col1[1], col2[1]])
-                    b = lin_interpolate(tt, [t, t + duration], [col1[2], col2[2]])
-                    inputvalues.append((r, g, b))
-                self.events.append((tt, self.change_color, acts, inputvalues))
+            col1 = [a.color() for a in acts]
+            cols = np.linspace(col1, get_color(c), len(rng))  # shape (nsteps+1, nactors, 3)
+            self._book(rng, self.change_color, acts, cols.tolist())
         else:
             for i, a in enumerate(self._performers):
                 a.color(self._inputvalues[i])
@@ -1358,22 +1674,16 @@ class Animation(Plotter):
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
 
-            col2 = get_color(c)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    if a.GetBackfaceProperty():
-                        col1 = a.backColor()
-                        r = lin_interpolate(tt, [t, t + duration], [col1[0], col2[0]])
-                        g = lin_interpolate(tt, [t, t + duration], [col1[1], col2[1]])
-                        b = lin_interpolate(tt, [t, t + duration], [col1[2], col2[2]])
-                        inputvalues.append((r, g, b))
-                    else:
-                        inputvalues.append(None)
-                self.events.append((tt, self.change_backcolor, acts, inputvalues))
+            noback = [i for i, a in enumerate(acts) if not a.GetBackfaceProperty()]
+            col1 = [(0, 0, 0) if i in noback else a.backcolor() for i, a in enumerate(acts)]
+            cols = np.linspace(col1, get_color(c), len(rng)).tolist()  # (nsteps+1, nactors, 3)
+            for inputvalues in cols:
+                for i in noback:
+                    inputvalues[i] = None
+            self._book(rng, self.change_backcolor, acts, cols)
         else:
             for i, a in enumerate(self._performers):
-                a.backColor(self._inputvalues[i])
+                a.backcolor(self._inputvalues[i])
         return self
 
     def change_to_wireframe(self, acts=None, t=None):
@@ -1400,12 +1710,9 @@ class Animation(Plotter):
         """Gradually change line width of the mesh edges for the input list of meshes."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    newlw = lin_interpolate(tt, [t, t + duration], [a.lw(), lw])
-                    inputvalues.append(newlw)
-                self.events.append((tt, self.change_line_width, acts, inputvalues))
+            lw0 = [a.lw() for a in acts]
+            lws = np.linspace(lw0, lw, len(rng))  # shape (nsteps+1, nactors)
+            self._book(rng, self.change_line_width, acts, lws.tolist())
         else:
             for i, a in enumerate(self._performers):
                 a.lw(self._inputvalues[i])
@@ -1415,16 +1722,9 @@ class Animation(Plotter):
         """Gradually change line color of the mesh edges for the input list of meshes."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            col2 = get_color(c)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    col1 = a.linecolor()
-                    r = lin_interpolate(tt, [t, t + duration], [col1[0], col2[0]])
-                    g = lin_interpolate(tt, [t, t + duration], [col1[1], col2[1]])
-                    b = lin_interpolate(tt, [t, t + duration], [col1[2], col2[2]])
-                    inputvalues.append((r, g, b))
-                self.events.append((tt, self.change_line_color, acts, inputvalues))
+            col1 = [a.linecolor() for a in acts]
+            cols = np.linspace(col1, get_color(c), len(rng))  # shape (nsteps+1, nactors, 3)
+            self._book(rng, self.change_line_color, acts, cols.tolist())
         else:
             for i, a in enumerate(self._performers):
                 a.linecolor(self._inputvalues[i])
@@ -1447,20 +1747,14 @@ class Animation(Plotter):
             else:
                 vedo.logger.error(f"Unknown lighting style {style}")
 
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    pr = a.GetProperty()
-                    aa = pr.GetAmbient()
-                    ad = pr.GetDiffuse()
-                    asp = pr.GetSpecular()
-                    aspp = pr.GetSpecularPower()
-                    naa  = lin_interpolate(tt, [t,t+duration], [aa,  pars[0]])
-                    nad  = lin_interpolate(tt, [t,t+duration], [ad,  pars[1]])
-                    nasp = lin_interpolate(tt, [t,t+duration], [asp, pars[2]])
-                    naspp= lin_interpolate(tt, [t,t+duration], [aspp,pars[3]])
-                    inputvalues.append((naa, nad, nasp, naspp))
-                self.events.append((tt, self.change_lighting, acts, inputvalues))
+            pars0 = []
+            for a in acts:
+                pr = a.GetProperty()
+                pars0.append(
+                    (pr.GetAmbient(), pr.GetDiffuse(), pr.GetSpecular(), pr.GetSpecularPower())
+                )
+            vals = np.linspace(pars0, pars[:4], len(rng))  # shape (nsteps+1, nactors, 4)
+            self._book(rng, self.change_lighting, acts, vals.tolist())
         else:
             for i, a in enumerate(self._performers):
                 pr = a.GetProperty()
@@ -1480,14 +1774,11 @@ class Animation(Plotter):
             cpos = acts[0].pos()
             pt = np.array(pt)
             dv = (pt - cpos) / len(rng)
-            for j, tt in enumerate(rng):
-                i = j + 1
-                if "quad" in style:
-                    x = i / len(rng)
-                    y = x * x
-                    self.events.append((tt, self.move, acts, cpos + dv * i * y))
-                else:
-                    self.events.append((tt, self.move, acts, cpos + dv * i))
+            w = np.arange(1, len(rng) + 1, dtype=float)  # step weights
+            if "quad" in style:
+                w *= (w / len(rng)) ** 2
+            path = cpos + dv * w[:, None]  # shape (nsteps+1, 3)
+            self._book(rng, self.move, acts, path)
         else:
             self._performers[0].pos(self._inputvalues)
         return self
@@ -1498,9 +1789,7 @@ class Animation(Plotter):
             acts, t, duration, rng = self._parse(act, t, duration)
             if len(acts) != 1:
                 vedo.logger.error("in rotate(), can move only one object.")
-            for tt in rng:
-                ang = angle / len(rng)
-                self.events.append((tt, self.rotate, acts, (axis, ang)))
+            self._book(rng, self.rotate, acts, repeat((axis, angle / len(rng))))
         else:
             ax = self._inputvalues[0]
             if ax == "x":
@@ -1515,9 +1804,7 @@ class Animation(Plotter):
         """Smoothly scale a specific object to a specified scale factor."""
         if self.bookingMode:
             acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                fac = lin_interpolate(tt, [t, t + duration], [1, factor])
-                self.events.append((tt, self.scale, acts, fac))
+            self._book(rng, self.scale, acts, np.linspace(1, factor, len(rng)).tolist())
         else:
             for a in self._performers:
                 a.scale(self._inputvalues)
@@ -1543,24 +1830,43 @@ class Animation(Plotter):
                 (x1, y1, z1),
                 (x0, y1, z1),
             ]
-            pcl = acts[0].closest_point(corners[corner])
-            dmin = np.linalg.norm(pcl - corners[corner])
-            for tt in rng:
-                d = lin_interpolate(tt, [t, t + duration], [dmin, diag * 1.01])
-                if d > 0:
-                    ids = acts[0].closest_point(corners[corner], radius=d, return_point_id=True)
-                    if len(ids) <= acts[0].npoints:
-                        self.events.append((tt, self.mesh_erode, acts, ids))
+            c0 = np.array(corners[corner])
+            dpcl = acts[0].closest_point(c0) - c0
+            dmin = np.sqrt(dpcl @ dpcl)
+            # sort the points by squared distance to the corner once, then each
+            # radius query is just a binary search, no sqrt over the points needed
+            dv = acts[0].points().astype(float) - c0
+            d2 = np.einsum("ij,ij->i", dv, dv)
+            order = np.argsort(d2)
+            d2_sorted = d2[order]
+            radii = np.linspace(dmin, diag * 1.01, len(rng))
+            ks = np.searchsorted(d2_sorted, radii * radii, side="right")
+            self.events.extend(
+                [
+                    (tt, self.mesh_erode, acts, order[:k])
+                    for tt, d, k in zip(rng.tolist(), radii, ks)
+                    if d > 0
+                ]
+            )
         return self
 
     def play(self):
         """Play the internal list of events and save a video."""
 
-        self.events = sorted(self.events, key=lambda x: x[0])
+        # sort the event times in C, stable so equal times keep their booking order
+        nevents = len(self.events)
+        times = np.fromiter((e[0] for e in self.events), dtype=float, count=nevents)
+        order = np.argsort(times, kind="stable")
+        self.events = [self.events[i] for i in order]
         self.bookingMode = False
 
+        # group the events sharing the same time so that each frame is rendered once
+        uniq, starts = np.unique(times[order], return_index=True)
+        starts = np.append(starts, nevents).tolist()
+
         if self.show_progressbar:
-            pb = vedo.ProgressBar(0, len(self.events), c="g")
+            pbstep = max(1, nevents // 100)
+            pb = vedo.ProgressBar(0, nevents, step=pbstep, c="g")
 
         if self.total_duration is None:
             self.total_duration = self.events[-1][0] - self.events[0][0]
@@ -1569,10 +1875,16 @@ class Animation(Plotter):
             vd = vedo.Video(self.video_filename, fps=self.video_fps, duration=self.total_duration)
 
         ttlast = 0
-        for e in self.events:
+        for k, tt in enumerate(uniq.tolist()):
 
-            tt, action, self._performers, self._inputvalues = e
-            action(0, 0)
+            for i in range(starts[k], starts[k + 1]):
+                _, action, self._performers, self._inputvalues = self.events[i]
+                action(0, 0)
+
+                if self.show_progressbar and ((i + 1) % pbstep == 0 or i + 1 == nevents):
+                    if (i + 1) % pbstep:
+                        pb.step = nevents % pbstep  # last partial stride, stay within the range
+                    pb.print("t=" + str(int(tt * 100) / 100) + "s,  " + action.__name__)
 
             dt = tt - ttlast
             if dt > self.eps:
@@ -1586,9 +1898,6 @@ class Animation(Plotter):
 
             ttlast = tt
 
-            if self.show_progressbar:
-                pb.print("t=" + str(int(tt * 100) / 100) + "s,  " + action.__name__)
-
         self.show(interactive=False, resetcam=self.resetcam)
         if self.video_filename:
             vd.add_frame()
@@ -1662,8 +1971,8 @@ class AnimationPlayer(vedo.Plotter):
         super().__init__(**kwargs)
 
         min_value, max_value = np.array(irange).astype(int)
-        button_pos = np.array(button_pos)
-        slider_pos = np.array(slider_pos)
+        bx, by = float(button_pos[0]), float(button_pos[1])
+        sx, sy = float(slider_pos[0]), float(slider_pos[1])
 
         self._func = func
 
@@ -1676,10 +1985,14 @@ class AnimationPlayer(vedo.Plotter):
 
         self.timer_callback_id = self.add_callback("timer", self._handle_timer)
         self.timer_id = None
+        self._pending_value = None  # last slider value not yet passed to func
+        self._slider_timer_id = None  # one shot timer that will pass it
+        self._last_tick = time.monotonic()
+        self._serving = False
 
         self.play_pause_button = self.add_button(
             self.toggle,
-            pos=button_pos,  # x,y fraction from bottom left corner
+            pos=(bx, by),  # x,y fraction from bottom left corner
             states=[self.PLAY_SYMBOL, self.PAUSE_SYMBOL],
             font="Kanopus",
             size=button_size,
@@ -1688,7 +2001,7 @@ class AnimationPlayer(vedo.Plotter):
         )
         self.button_oneback = self.add_button(
             self.onebackward,
-            pos=(-button_gap, 0) + button_pos,
+            pos=(bx - button_gap, by),
             states=[self.ONE_BACK_SYMBOL],
             font="Kanopus",
             size=button_size,
@@ -1698,7 +2011,7 @@ class AnimationPlayer(vedo.Plotter):
         )
         self.button_oneforward = self.add_button(
             self.oneforward,
-            pos=(button_gap, 0) + button_pos,
+            pos=(bx + button_gap, by),
             states=[self.ONE_FORWARD_SYMBOL],
             font="Kanopus",
             size=button_size,
@@ -1711,7 +2024,7 @@ class AnimationPlayer(vedo.Plotter):
             self.min_value,
             self.max_value - 1,
             value=self.min_value,
-            pos=[(d-0.5, 0)+slider_pos, (0.5-d, 0)+slider_pos],
+            pos=[(sx + d - 0.5, sy), (sx + 0.5 - d, sy)],
             show_value=False,
             c=bc[0],
             alpha=1,
@@ -1730,6 +2043,7 @@ class AnimationPlayer(vedo.Plotter):
         if self.timer_id is not None:
             self.timer_callback("destroy", self.timer_id)
         self.timer_id = self.timer_callback("create", dt=int(self.dt))
+        self._last_tick = time.monotonic()
         self.is_playing = True
         self.play_pause_button.status(self.PAUSE_SYMBOL)
 
@@ -1756,10 +2070,8 @@ class AnimationPlayer(vedo.Plotter):
     def set_frame(self, value: int) -> None:
         """Set the current value of the animation."""
         if self._loop:
-            if value < self.min_value:
-                value = self.max_value - 1
-            elif value >= self.max_value:
-                value = self.min_value
+            # wrap around, also for jumps of more than one frame
+            value = self.min_value + (value - self.min_value) % (self.max_value - self.min_value)
         else:
             if value < self.min_value:
                 self.pause()
@@ -1775,10 +2087,45 @@ class AnimationPlayer(vedo.Plotter):
 
     def _slider_callback(self, widget: SliderWidget, _: str) -> None:
         self.pause()
-        self.set_frame(int(round(widget.value)))
-
-    def _handle_timer(self, _: Event = None) -> None:
-        self.set_frame(self.value + 1)
+        value = int(round(widget.value))
+        if not self.interactor:
+            self.set_frame(value)
+            return
+        # dragging fires many events per frame: keep only the most recent value
+        # and let a one shot timer call func once with it
+        if self._slider_timer_id is None:
+            if value == self.value:
+                return
+            self._slider_timer_id = self.timer_callback("create", dt=16, one_shot=True)
+        self._pending_value = value
+
+    def _handle_timer(self, evt: Event = None) -> None:
+        # the timer event is shared with any other timer, only act on our own ones
+        timerid = getattr(evt, "timerid", None)
+        if timerid is not None and timerid == self._slider_timer_id:
+            self._slider_timer_id = None
+            if self._serving:
+                # func is still running, try again at the next tick
+                self._slider_timer_id = self.timer_callback("create", dt=16, one_shot=True)
+                return
+            if self._pending_value is None:
+                return
+            value, self._pending_value = self._pending_value, None
+        elif timerid is not None and timerid != self.timer_id:
+            return
+        elif self._serving or not self.is_playing:
+            return  # func is still running, or a timer fired after pause
+        else:
+            # if func is slower than dt skip the late frames instead of falling behind
+            now = time.monotonic()
+            step = max(1, int((now - self._last_tick) * 1000 // self.dt))
+            self._last_tick = now
+            value = self.value + step
+        self._serving = True
+        try:
+            self.set_frame(value)
+        finally:
+            self._serving = False
 
     def stop(self) -> "AnimationPlayer":
         """
@@ -1805,6 +2152,15 @@ class AnimationPlayer(vedo.Plotter):
 class Clock(vedo.Assembly):
     """Clock animation."""
 
+    # unit vectors of the hands for the 720 minutes of a 12h dial and the 60 seconds
+    _T_HM = np.arange(720) / 720
+    _HM_ANG = 2 * np.pi * _T_HM + np.pi / 2
+    _HM_X, _HM_Y = np.cos(_HM_ANG), np.sin(_HM_ANG)
+    _HM_BETA = 12 * 2 * np.pi * _T_HM + np.pi / 2
+    _HM_BX, _HM_BY = np.cos(_HM_BETA), np.sin(_HM_BETA)
+    _S_ANG = np.arange(60) * 2 * np.pi / 60 + np.pi / 2
+    _S_X, _S_Y = np.cos(_S_ANG), np.sin(_S_ANG)
+
     def __init__(self, h=None, m=None, s=None, font="Quikhand", title="", c="k"):
         """
         Create a clock with current time or user provided time.
@@ -1853,37 +2209,44 @@ class Clock(vedo.Assembly):
 
         h = int(h) % 24
         m = int(m) % 60
-        t = (h * 60 + m) / 12 / 60
-
-        alpha = 2 * np.pi * t + np.pi / 2
-        beta = 12 * 2 * np.pi * t + np.pi / 2
-
-        x1, y1 = np.cos(alpha), np.sin(alpha)
-        x2, y2 = np.cos(beta), np.sin(beta)
+        (x1, y1), (x2, y2) = Clock._hm_hands(h, m)
         if s is not None:
             s = int(s) % 60
-            gamma = s * 2 * np.pi / 60 + np.pi / 2
-            x3, y3 = np.cos(gamma), np.sin(gamma)
+            x3, y3 = Clock._S_X[s], Clock._S_Y[s]
 
-        ore = Line([0, 0], [x1, y1], lw=14, c="red4").scale(0.5).mirror()
-        minu = Line([0, 0], [x2, y2], lw=7, c="blue3").scale(0.75).mirror()
+        ore = Line([0, 0, 0], [-x1 * 0.5, y1 * 0.5, 0], lw=14, c="red4")
+        minu = Line([0, 0, 0.002], [-x2 * 0.75, y2 * 0.75, 0.002], lw=7, c="blue3")
         secs = None
         if s is not None:
-            secs = Line([0, 0], [x3, y3], lw=1, c="k").scale(0.95).mirror()
-            secs.z(0.003)
+            secs = Line([0, 0, 0.003], [-x3 * 0.95, y3 * 0.95, 0.003], lw=1, c="k")
         back1 = vedo.shapes.Circle(res=180, c="k5")
-        back2 = vedo.shapes.Circle(res=12).mirror().scale(0.84).rotate_z(-360 / 12)
-        labels = back2.labels(range(1, 13), justify="center", font=font, c=c, scale=0.14)
+        labels = Clock._build_labels(font, tuple(get_color(c))).clone()
         txt = vedo.shapes.Text3D(wd + title, font="VictorMono", justify="top-center", s=0.07, c=c)
         txt.pos(0, -0.25, 0.001)
         labels.z(0.001)
-        minu.z(0.002)
         vedo.Assembly.__init__(self, [back1, labels, ore, minu, secs, txt])
         self.name = "Clock"
+        self._last_hm = (h, m)
+        self._last_s = s
+        # the hands are built in place, update() moves their tips directly
+        self._hand_vtkpts = [a.polydata(False).GetPoints() if a else None for a in (ore, minu, secs)]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_labels(font, c):
+        # the 12 dial labels are the same for every clock with the same
+        # font and color: build them once and let instances clone them
+        back2 = vedo.shapes.Circle(res=12).mirror().scale(0.84).rotate_z(-360 / 12)
+        return back2.labels(range(1, 13), justify="center", font=font, c=c, scale=0.14)
+
+    @staticmethod
+    def _hm_hands(h, m):
+        # hour and minute hands from the tables, 13:00 points like 1:00
+        idx = (h * 60 + m) % 720
+        return (Clock._HM_X[idx], Clock._HM_Y[idx]), (Clock._HM_BX[idx], Clock._HM_BY[idx])
 
     def update(self, h=None, m=None, s=None):
         """Update clock with current or user time."""
-        parts = self.unpack()
         self.elapsed = time.time() - self._start
 
         if h is None and m is None:
@@ -1894,29 +2257,23 @@ class Clock(vedo.Assembly):
 
         h = int(h) % 24
         m = int(m) % 60
-        t = (h * 60 + m) / 12 / 60
-
-        alpha = 2 * np.pi * t + np.pi / 2
-        beta = 12 * 2 * np.pi * t + np.pi / 2
-
-        x1, y1 = np.cos(alpha), np.sin(alpha)
-        x2, y2 = np.cos(beta), np.sin(beta)
-        if s is not None:
+        hpts, mpts, spts = self._hand_vtkpts
+
+        # the hour and minute hands only move once a minute
+        if (h, m) != self._last_hm:
+            self._last_hm = (h, m)
+            (x1, y1), (x2, y2) = Clock._hm_hands(h, m)
+            hpts.SetPoint(1, -x1 * 0.5, y1 * 0.5, 0.001)
+            hpts.Modified()
+            mpts.SetPoint(1, -x2 * 0.75, y2 * 0.75, 0.002)
+            mpts.Modified()
+
+        if s is not None and spts is not None:
             s = int(s) % 60
-            gamma = s * 2 * np.pi / 60 + np.pi / 2
-            x3, y3 = np.cos(gamma), np.sin(gamma)
-
-        pts2 = parts[2].points()
-        pts2[1] = [-x1 * 0.5, y1 * 0.5, 0.001]
-        parts[2].points(pts2)
-
-        pts3 = parts[3].points()
-        pts3[1] = [-x2 * 0.75, y2 * 0.75, 0.002]
-        parts[3].points(pts3)
-
-        if s is not None:
-            pts4 = parts[4].points()
-            pts4[1] = [-x3 * 0.95, y3 * 0.95, 0.003]
-            parts[4].points(pts4)
+            if s != self._last_s:
+                self._last_s = s
+                x3, y3 = Clock._S_X[s], Clock._S_Y[s]
+                spts.SetPoint(1, -x3 * 0.95, y3 * 0.95, 0.003)
+                spts.Modified()
 
         return self
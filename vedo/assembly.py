@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import base64
+import io
+
 import numpy as np
 
 try:
@@ -7,6 +10,11 @@ try:
 except ImportError:
     import vtkmodules.all as vtk
 
+try:
+    from PIL import Image as _PIL_Image  # only needed for the notebook thumbnail
+except ImportError:
+    _PIL_Image = None
+
 import vedo
 
 __docformat__ = "google"
@@ -43,9 +51,10 @@ def procrustes_alignment(sources, rigid=False):
         ![](https://vedo.embl.es/images/basic/align4.png)
     """
 
+    n0 = sources[0].npoints
     group = vtk.vtkMultiBlockDataGroupFilter()
     for source in sources:
-        if sources[0].npoints != source.npoints:
+        if source.npoints != n0:
             vedo.logger.error("sources have different nr of points")
             raise RuntimeError()
         group.AddInputData(source.polydata())
@@ -56,13 +65,12 @@ def procrustes_alignment(sources, rigid=False):
         procrustes.GetLandmarkTransform().SetModeToRigidBody()
     procrustes.Update()
 
+    output = procrustes.GetOutput()
     acts = []
     for i, s in enumerate(sources):
-        poly = procrustes.GetOutput().GetBlock(i)
-        mesh = vedo.mesh.Mesh(poly)
+        mesh = vedo.mesh.Mesh(output.GetBlock(i))
         mesh.SetProperty(s.GetProperty())
-        if hasattr(s, "name"):
-            mesh.name = s.name
+        mesh.name = getattr(s, "name", mesh.name)
         acts.append(mesh)
     assem = Assembly(acts)
     assem.transform = procrustes.GetLandmarkTransform()
@@ -91,6 +99,9 @@ class Group(vtk.vtkPropAssembly):
         self.transform = None
         self.scalarbar = None
 
+        self._elements = []
+        self._elements_mtime = -1  # mtime of the parts collection when _elements was built
+
         for a in vedo.utils.flatten(objects):
             if a:
                 self.AddPart(a)
@@ -110,13 +121,19 @@ class Group(vtk.vtkPropAssembly):
 
     def unpack(self):
         """Unpack the group into its elements"""
+        parts = self.GetParts()
+        mtime = parts.GetMTime()  # bumped by any AddPart/RemovePart
+        if mtime == self._elements_mtime:
+            return list(self._elements)
+
         elements = []
         self.InitPathTraversal()
-        parts = self.GetParts()
         parts.InitTraversal()
         for i in range(parts.GetNumberOfItems()):
             ele = parts.GetItemAsObject(i)
             elements.append(ele)
+        self._elements = elements
+        self._elements_mtime = mtime
 
         # gr.InitPathTraversal()
         # for _ in range(gr.GetNumberOfPaths()):
@@ -127,11 +144,12 @@ class Group(vtk.vtkPropAssembly):
         #         a = path.GetItemAsObject(i).GetViewProp()
         #         print([a])
 
-        return elements
+        return list(elements)
 
     def clear(self):
         """Remove all parts"""
-        for a in self.unpack():
+        # remove from the end so that vtk does not shift the remaining items
+        for a in reversed(self.unpack()):
             self.RemovePart(a)
         return self
 
@@ -238,8 +256,9 @@ class Assembly(vedo.base.Base3DProp, vtk.vtkAssembly):
         for a in meshs:
             if isinstance(a, vtk.vtkProp3D):  # and a.GetNumberOfPoints():
                 self.AddPart(a)
-            if hasattr(a, "scalarbar") and a.scalarbar is not None:
-                scalarbars.append(a.scalarbar)
+            sb = getattr(a, "scalarbar", None)
+            if sb is not None:
+                scalarbars.append(sb)
 
         if len(scalarbars) > 1:
             self.scalarbar = Group(scalarbars)
@@ -258,27 +277,27 @@ class Assembly(vedo.base.Base3DProp, vtk.vtkAssembly):
         Returns:
             HTML text with the image and some properties.
         """
-        import io
-        import base64
-        from PIL import Image
+        if _PIL_Image is None:
+            return None  # let the notebook fall back to the plain text repr
 
         library_name = "vedo.assembly.Assembly"
         help_url = "https://vedo.embl.es/docs/vedo/assembly.html"
 
         arr = self.thumbnail(zoom=1.1, elevation=-60)
 
-        im = Image.fromarray(arr)
+        im = _PIL_Image.fromarray(arr)
         buffered = io.BytesIO()
-        im.save(buffered, format="PNG", quality=100)
+        im.save(buffered, format="PNG", compress_level=1)  # png is lossless, quality is ignored
         encoded = base64.b64encode(buffered.getvalue()).decode("utf-8")
         url = "data:image/png;base64," + encoded
         image = f"<img src='{url}'></img>"
 
         # statisitics
+        bnds = self.bounds()
         bounds = "<br/>".join(
             [
                 vedo.utils.precision(min_x, 4) + " ... " + vedo.utils.precision(max_x, 4)
-                for min_x, max_x in zip(self.bounds()[::2], self.bounds()[1::2])
+                for min_x, max_x in zip(bnds[::2], bnds[1::2])
             ]
         )
 
@@ -341,16 +360,22 @@ class Assembly(vedo.base.Base3DProp, vtk.vtkAssembly):
         self.pipeline = vedo.utils.OperationNode("add mesh", parents=[self, obj], c="#f08080")
         return self
 
+    def bounds(self):
+        """
+        Get the object bounds.
+        Returns a list in format `[xmin,xmax, ymin,ymax, zmin,zmax]`.
+        """
+        # an Assembly has no points(), ask vtk directly instead of
+        # going through the exception raised by the generic method
+        return self.GetBounds()
+
     def __contains__(self, obj):
         """Allows to use ``in`` to check if an object is in the Assembly."""
         return obj in self.actors
 
     def clone(self):
         """Make a clone copy of the object."""
-        newlist = []
-        for a in self.actors:
-            newlist.append(a.clone())
-        return Assembly(newlist)
+        return Assembly([a.clone() for a in self.actors])
 
     def unpack(self, i=None, transformed=False):
         """Unpack the list of objects from a ``Assembly``.
@@ -381,26 +406,18 @@ class Assembly(vedo.base.Base3DProp, vtk.vtkAssembly):
     def recursive_unpack(self):
         """Flatten out an Assembly."""
 
-        def _genflatten(lst):
-            if not lst:
-                return []
-            ##
-            if isinstance(lst[0], Assembly):
-                lst = lst[0].unpack()
-            ##
-            for elem in lst:
-                if isinstance(elem, Assembly):
-                    apos = elem.GetPosition()
-                    asum = np.sum(apos)
-                    for x in elem.unpack():
-                        if asum:
-                            yield x.clone().shift(apos)
-                        else:
-                            yield x
+        flat = []
+        for elem in self.unpack():
+            if isinstance(elem, Assembly):
+                apos = elem.GetPosition()
+                # a position like (1,-1,0) sums to zero but still needs the shift
+                if any(apos):
+                    flat.extend([x.clone().shift(apos) for x in elem.unpack()])
                 else:
-                    yield elem
-
-        return list(_genflatten([self]))
+                    flat.extend(elem.unpack())
+            else:
+                flat.append(elem)
+        return flat
 
     def pickable(self, value=None):
         """Set/get the pickability property of an assembly and its elements"""
@@ -2739,6 +2739,7 @@ class Mesh(Points):
         ins[ids] = 1
 
         if debug:
+            import vedo.pyplot
             # vedo.pyplot.histogram(fillpts.pointdata["Distance"], xtitle=f"gap={gap}").show().close()
             edges = self.edges()
             points = self.points()
@@ -4612,8 +4612,8 @@ class Points(BaseActor, vtk.vtkActor):
 
         length = contour.length()
         density = length / contour.npoints
-        vedo.logger.debug(f"tomesh():\n\tline length = {length}")
-        vedo.logger.debug(f"\tdensity = {density} length/pt_separation")
+        vedo.logger.debug("tomesh():\n\tline length = %s", length)
+        vedo.logger.debug("\tdensity = %s length/pt_separation", density)
 
         x0, x1 = contour.xbounds()
         y0, y1 = contour.ybounds()
@@ -4622,7 +4622,7 @@ class Points(BaseActor, vtk.vtkActor):
             if mesh_resolution is None:
                 resx = int((x1 - x0) / density + 0.5)
                 resy = int((y1 - y0) / density + 0.5)
-                vedo.logger.debug(f"tmesh_resolution = {[resx, resy]}")
+                vedo.logger.debug("tmesh_resolution = [%s, %s]", resx, resy)
             else:
                 if utils.is_sequence(mesh_resolution):
                     resx, resy = mesh_resolution
@@ -4661,7 +4661,7 @@ class Points(BaseActor, vtk.vtkActor):
         if jitter:
             np.random.seed(0)
             sigma = 1.0 / np.sqrt(grid.npoints) * grid.diagonal_size() * jitter
-            vedo.logger.debug(f"\tsigma jittering = {sigma}")
+            vedo.logger.debug("\tsigma jittering = %s", sigma)
             grid_tmp += np.random.rand(grid.npoints, 3) * sigma
             grid_tmp[:, 2] = 0.0
 
@@ -3951,6 +3951,7 @@ def CornerHistogram(
     lines=True,
     dots=False,
     nmax=None,
+    weights=None,
 ):
     """
     Build a histogram from a list of values in n bins.
@@ -3960,6 +3961,8 @@ def CornerHistogram(
 
     Use `nmax` to limit the sampling to this max nr of entries
 
+    Use `weights` to assign a weight to each entry of `values`
+
     Use `pos` to assign its position:
         - 1, topleft,
         - 2, topright,
@@ -3975,8 +3978,10 @@ def CornerHistogram(
         # subsample:
         idxs = np.linspace(0, n, num=int(nmax), endpoint=False).astype(int)
         values = values[idxs]
+        if weights is not None:
+            weights = np.asarray(weights)[idxs]
 
-    fs, edges = np.histogram(values, bins=bins, range=vrange)
+    fs, edges = np.histogram(values, bins=bins, weights=weights, range=vrange)
 
     if minbin:
         fs = fs[minbin:-1]